@@ -12,6 +12,29 @@ import bpy
 from mathutils import Vector, Quaternion
 import bmesh
 
+def _plane_normal_from_selection(obj):
+    """Return the world-space normal of the plane through the 3 selected vertices,
+    or None if the selection is not exactly 3 vertices."""
+    bm = bmesh.from_edit_mesh(obj.data)
+    # Stop scanning as soon as a 4th selected vertex rules out a valid plane.
+    selected_verts = []
+    append = selected_verts.append
+    for v in bm.verts:
+        if v.select:
+            append(v)
+            if len(selected_verts) > 3:
+                break
+
+    if len(selected_verts) != 3:
+        return None
+
+    v1, v2, v3 = selected_verts
+    mw = obj.matrix_world
+    v1_world = mw @ v1.co
+    vec1 = mw @ v2.co - v1_world
+    vec2 = mw @ v3.co - v1_world
+    return vec1.cross(vec2).normalized()
+
 class AlignViewOperator(bpy.types.Operator):
     """Align Viewport to Plane Defined by 3 Selected Vertices"""
     bl_idname = "object.align_view_to_plane"
@@ -24,23 +47,11 @@ class AlignViewOperator(bpy.types.Operator):
             self.report({'ERROR_INVALID_CONTEXT'}, "Please be in Edit Mode with an active object.")
             return {'CANCELLED'}
 
-        mesh = obj.data
-        bm = bmesh.from_edit_mesh(mesh)
-        selected_verts = [v for v in bm.verts if v.select]
-        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
-
-        if len(selected_verts) != 3:
+        plane_normal = _plane_normal_from_selection(obj)
+        if plane_normal is None:
             self.report({'ERROR_INVALID_INPUT'}, "Please select exactly 3 vertices.")
             return {'CANCELLED'}
 
-        v1_world = obj.matrix_world @ selected_verts[0].co
-        v2_world = obj.matrix_world @ selected_verts[1].co
-        v3_world = obj.matrix_world @ selected_verts[2].co
-
-        vec1 = v2_world - v1_world
-        vec2 = v3_world - v1_world
-        plane_normal = vec1.cross(vec2).normalized()
-
         region_3d = context.region_data
         if region_3d is None:
             self.report({'ERROR_INVALID_CONTEXT'}, "Not in a 3D viewport.")
@@ -63,13 +74,12 @@ class PlaneAlignPanel(bpy.types.Panel):
         layout = self.layout
         layout.operator(AlignViewOperator.bl_idname)
 
-def register():
-    bpy.utils.register_class(AlignViewOperator)
-    bpy.utils.register_class(PlaneAlignPanel)
+_CLASSES = (
+    AlignViewOperator,
+    PlaneAlignPanel,
+)
 
-def unregister():
-    bpy.utils.unregister_class(AlignViewOperator)
-    bpy.utils.unregister_class(PlaneAlignPanel)
+register, unregister = bpy.utils.register_classes_factory(_CLASSES)
 
 if __name__ == "__main__":
     register()
\ No newline at end of file